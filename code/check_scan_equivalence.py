@@ -0,0 +1,314 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Equivalence check for the fused scanners in run_qwen_kb_qa.py.
+
+critical_flags, term_metrics and person_eval are built on single-pass scanners
+(fact_re / markup_re, the term trie, the cached KB lookups). This script runs
+them side by side with the original one-regex-per-check implementations, kept
+below as the reference, and reports any pair of texts on which they disagree.
+Run it after editing fact_re / markup_re or any of the checks built on them.
+
+Inputs:
+  --term_tsv     plant_morphology_glossary_zh_en_v1.tsv
+  --names_xlsx   author_name_authority_file_v1.xlsx
+  --key_xlsx / --desc_xlsx  (optional) input workbooks; their rows are checked
+                 as-is and cross-paired
+
+Options:
+  --n            randomized pairs per generator (default 20000)
+  --seed         RNG seed (default 0)
+
+Exits with status 1 and prints the first mismatches if any output differs.
+"""
+
+import argparse, os, random, re, sys
+import pandas as pd
+from collections import defaultdict, Counter
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+import run_qwen_kb_qa as qa
+
+# --- reference implementations (as before the scanners were fused) ---
+num_re = re.compile(r'(?<![A-Za-z])(\d+(?:\.\d+)?)')
+range_re = re.compile(r'(\d+(?:\.\d+)?)\s*[–\-~－]\s*(\d+(?:\.\d+)?)')
+unit_en_re = re.compile(r'\b(mm|cm|dm|m|km|µm|um)\b', re.IGNORECASE)
+word_re = re.compile(r"[A-Za-z]+(?:-[A-Za-z]+)*")
+tag_re = re.compile(r'<\s*/?\s*([A-Za-z0-9]+)[^>]*>')
+
+def ref_norm_ws(s):
+    return re.sub(r'\s+', ' ', str(s or '')).strip()
+
+def ref_strip_html(s):
+    return re.sub(r'<[^>]+>', '', str(s or ''))
+
+def ref_units_pass(en, zh):
+    en_units = [u.lower() for u in unit_en_re.findall(en or "")]
+    if not en_units:
+        return True
+    z = str(zh or "")
+    for u in en_units:
+        if not any(c in z for c in qa.unit_map.get(u, [u])):
+            return False
+    return True
+
+def ref_negation_pass(en, zh):
+    en_l = (en or "").lower()
+    if not any(t in en_l for t in qa.neg_triggers):
+        return True
+    z = str(zh or "")
+    return any(c in z for c in qa.zh_cues)
+
+def ref_italic_binomials(text):
+    bins=[]
+    for it in re.findall(r'<i>\s*([^<]+?)\s*</i>', str(text or ""), flags=re.I):
+        bins += re.findall(r'\b([A-Z][a-z-]+)\s+([a-z-]{2,})\b', ref_strip_html(it))
+    return bins
+
+def ref_binomial_pass(en, zh):
+    bins = ref_italic_binomials(en)
+    if not bins:
+        return True
+    z = ref_strip_html(zh).lower()
+    return all(f"{g} {s}".lower() in z for g,s in bins)
+
+def ref_symbols_pass(en, zh):
+    return all(sym not in (en or "") or sym in (zh or "") for sym in ["±","×"])
+
+def ref_tag_mismatch(en, zh):
+    en_tags = [t.lower() for t in tag_re.findall(en or "")]
+    return bool(en_tags) and Counter(en_tags) != Counter(t.lower() for t in tag_re.findall(zh or ""))
+
+def ref_critical_flags(en, zh):
+    flags=[]
+    en_clean = ref_strip_html(en or "")
+    zh_clean = ref_strip_html(zh or "")
+    en_nums = num_re.findall(en_clean)
+    if en_nums and Counter(en_nums) != Counter(num_re.findall(zh_clean)):
+        flags.append("NUM")
+    if range_re.search(en_clean) and not range_re.search(zh_clean):
+        flags.append("RANGE")
+    if not ref_units_pass(en_clean, zh_clean):
+        flags.append("UNIT")
+    if not ref_negation_pass(en_clean, zh_clean):
+        flags.append("NEGATION_CUE")
+    if not ref_binomial_pass(en, zh):
+        flags.append("BINOMIAL")
+    if not ref_symbols_pass(en, zh):
+        flags.append("SYMBOL")
+    if ref_tag_mismatch(en or "", zh or ""):
+        flags.append("TAG")
+    return tuple(flags)
+
+def ref_build_term_kb(term_tsv):
+    term_df = pd.read_csv(term_tsv, sep='\t').fillna("")
+    term_df = term_df.rename(columns={"名词(中文)":"zh","名词(英文)":"en"})
+    en2zh = defaultdict(set)
+    for _,r in term_df.iterrows():
+        zh = ref_norm_ws(r.get("zh",""))
+        en = ref_norm_ws(r.get("en",""))
+        if not zh or not en:
+            continue
+        for v in qa.make_en_variants(en):
+            en2zh[v].add(zh)
+    max_words = min(max((len(k.split()) for k in en2zh.keys()), default=4), 6)
+    return en2zh, max_words
+
+def ref_term_metrics(en2zh, max_words, en_text, zh_text):
+    tokens = [t.lower() for t in word_re.findall(ref_strip_html(en_text or ""))]
+    hits=set()
+    for n in range(1, max_words+1):
+        for i in range(0, len(tokens)-n+1):
+            ng = " ".join(tokens[i:i+n])
+            if ng in en2zh:
+                hits.add(ng)
+    hits = sorted(hits)
+    if not hits:
+        return 0, 0, None, [], {}
+    zh = str(zh_text or "")
+    ok=0
+    missing=[]
+    found_map={}
+    for en_term in hits:
+        found=[z for z in en2zh[en_term] if z and z in zh]
+        if found:
+            ok += 1
+            found_map[en_term]=sorted(found)
+        else:
+            missing.append(en_term)
+    return len(hits), ok, ok/len(hits), missing[:20], found_map
+
+def ref_build_name_kb(names_xlsx):
+    df = pd.read_excel(names_xlsx, sheet_name="Sheet1").fillna("")
+    abbr_map={}
+    fullname_map={}
+    cn_map={}
+    for i,r in df.iterrows():
+        cn_map[i]=ref_norm_ws(r.get("中文名",""))
+        for k in ["去掉空格的缩写","标准缩写"]:
+            ab = re.sub(r'\s+','', str(r.get(k,""))).strip()
+            if ab:
+                abbr_map[ab]=i
+        for k in ["全名，把逗号换成了空格","全名"]:
+            fn = ref_norm_ws(r.get(k,""))
+            if fn:
+                fn_norm = re.sub(r'\s+',' ', re.sub(r'[^a-z ]','', fn.lower())).strip()
+                if fn_norm:
+                    fullname_map[fn_norm]=i
+    return abbr_map, fullname_map, cn_map
+
+def ref_person_candidates(en):
+    cands=set()
+    for m in qa.abbr_candidate_re.findall(en) + qa.surname_period_re.findall(en):
+        cands.add(("abbr", re.sub(r'\s+','', m)))
+    for p in re.split(r'[;，,]| and ', re.sub(r'\([^)]*\)', ' ', en)):
+        p = ref_norm_ws(p)
+        if not p:
+            continue
+        p2 = re.sub(r'\s+',' ', re.sub(r'[^A-Za-z.\- ]+', ' ', p)).strip()
+        words=[w for w in p2.split() if re.search(r'[A-Za-z]', w)]
+        if len(words) >= 2:
+            cand = re.sub(r'\s+',' ', re.sub(r'[^a-z ]','', " ".join(words).lower())).strip()
+            if cand:
+                cands.add(("full", cand))
+    return cands
+
+def ref_person_eval(abbr_map, fullname_map, cn_map, en_text, zh_text):
+    en = en_text or ""
+    zh = str(zh_text or "")
+    matched=set()
+    expected=set()
+    verifiable=0
+    for kind, c in ref_person_candidates(en):
+        kb = abbr_map if kind == "abbr" else fullname_map
+        if c in kb:
+            idx=kb[c]
+            matched.add(idx)
+            cn=cn_map.get(idx,"")
+            if cn and cn not in ["【空】","?","？"]:
+                verifiable += 1
+                if cn not in zh:
+                    expected.add(cn)
+    if not matched:
+        return ("NA", 0, "", "", "")
+    return ("FAIL" if expected else "OK", verifiable, ";".join(sorted(expected)),
+            "CN_MISSING" if expected else "", ";".join(str(i) for i in sorted(matched)))
+
+# --- pair generators ---
+atoms = [
+    "1","2","10","3.5","0.5","12","007","a1","x2","2a","–","-","~","－"," - ","–",
+    " ","  ","\t","\n","\r","　","\xa0","_x000D_",
+    "mm","cm","dm","m","km","µm","um","Mm","CM","毫米","厘米","米",
+    "<i>","</i>","<I>","</I>","<b>","</b>","<br/>","< i >","</ i>","<","<<",">","<i","i>",
+    "<i>Rosa chinensis</i>","<I>Potentilla fruticosa</I>","<i> Rosa sericea var. </i>","<b ","<span a=",
+    "Rosa","chinensis","R.","sericea","var.","Potentilla","fruticosa","f.","subsp.",
+    "not","Not","without","usually","rarely","except","absent","notable",
+    "±","×","May","Jun","Sep.","leaves","leaf","petiole","Franch.","Rehder","W. W. Smith","T. T. Yu","and",
+    ";",",","，","(",")",".","叶","不","无","常","一般","5–6月","叶轴","花序轴",
+]
+
+def rand_text(rng, pool, k):
+    return "".join(rng.choice(pool) + rng.choice(["", " ", " "]) for _ in range(rng.randint(0, k)))
+
+def mutate(rng, s, pool):
+    toks = re.split(r'(\s+)', s)
+    for _ in range(rng.randint(0, 3)):
+        op = rng.random()
+        if op < 0.4 and toks:
+            toks.pop(rng.randrange(len(toks)))
+        elif op < 0.8:
+            toks.insert(rng.randint(0, len(toks)), rng.choice(pool))
+        elif toks:
+            rng.shuffle(toks)
+    return "".join(toks)
+
+def random_pairs(rng, n):
+    for _ in range(n):
+        en = rand_text(rng, atoms, 14)
+        yield en, (mutate(rng, en, atoms) if rng.random() < 0.6 else rand_text(rng, atoms, 14))
+
+def kb_pairs(rng, n, en2zh, names):
+    terms = list(en2zh)
+    pool = atoms + names
+    for _ in range(n):
+        en_parts=[]
+        zh_parts=[]
+        for _ in range(rng.randint(1, 8)):
+            r = rng.random()
+            if r < 0.5:
+                t = rng.choice(terms)
+                en_parts.append(rng.choice([t, t.title(), t.upper(), f"<i>{t}</i>", t + "s"]))
+                if rng.random() < 0.7:
+                    zh_parts.append(rng.choice(sorted(en2zh[t])))
+            elif r < 0.8:
+                en_parts.append(rng.choice(names))
+                zh_parts.append(rng.choice(pool))
+            else:
+                a = rng.choice(atoms)
+                en_parts.append(a)
+                zh_parts.append(a if rng.random() < 0.5 else rng.choice(atoms))
+        yield rng.choice([" ", ", ", "; ", " and "]).join(en_parts), "".join(zh_parts)
+
+def workbook_pairs(rng, paths, cols):
+    en_all=[]
+    zh_all=[]
+    for path, (en_col, zh_col) in zip(paths, cols):
+        if path:
+            df = pd.read_excel(path).fillna("")
+            en_all += [str(v) for v in qa.column(df, en_col)]
+            zh_all += [str(v) for v in qa.column(df, zh_col)]
+    yield from zip(en_all, zh_all)
+    # cross-paired and mutated rows
+    for en in en_all:
+        yield en, rng.choice(zh_all)
+        yield en, mutate(rng, rng.choice(zh_all), atoms)
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--term_tsv", required=True)
+    ap.add_argument("--names_xlsx", required=True)
+    ap.add_argument("--key_xlsx")
+    ap.add_argument("--desc_xlsx")
+    ap.add_argument("--n", type=int, default=20000)
+    ap.add_argument("--seed", type=int, default=0)
+    args = ap.parse_args()
+
+    qa.set_kbs(qa.load_kbs(args.term_tsv, args.names_xlsx))
+    ref_en2zh, ref_max_words = ref_build_term_kb(args.term_tsv)
+    ref_names = ref_build_name_kb(args.names_xlsx)
+    names = sorted(set(ref_names[0]) | set(ref_names[1])) + ["W. W. Smith", "T. T. Yu", "Yü", "Ze M. Wu & Z. L. Cheng"]
+
+    rng = random.Random(args.seed)
+    sources = [
+        ("random", list(random_pairs(rng, args.n))),
+        ("kb", list(kb_pairs(rng, args.n, ref_en2zh, names))),
+        ("workbooks", list(workbook_pairs(rng, [args.key_xlsx, args.desc_xlsx],
+                                          [("Description","Description_qw"), ("Content","Content_qw")]))),
+    ]
+
+    failures=0
+    for label, pairs in sources:
+        en_col = pd.Series([en for en,_ in pairs], dtype=object)
+        zh_col = pd.Series([zh for _,zh in pairs], dtype=object)
+        texts = qa.term_text(en_col).tolist()
+        sym_oks = qa.symbols_mask(en_col, zh_col).tolist()
+        for (en, zh), text, sym_ok in zip(pairs, texts, sym_oks):
+            checks = [
+                ("critical_flags", qa.critical_flags(en, zh, sym_ok), ref_critical_flags(en, zh)),
+                ("term_metrics", qa.term_metrics(text, zh), ref_term_metrics(ref_en2zh, ref_max_words, en, zh)),
+                ("person_eval", qa.person_eval(en, zh), ref_person_eval(*ref_names, en, zh)),
+            ]
+            for name, got, want in checks:
+                if got != want:
+                    failures += 1
+                    if failures <= 10:
+                        print(f"MISMATCH {label} {name}\n  en={en!r}\n  zh={zh!r}\n  got ={got!r}\n  want={want!r}")
+        print(f"{label}: {len(pairs)} pairs checked")
+
+    if failures:
+        print(f"{failures} mismatches")
+        sys.exit(1)
+    print("OK: fused checks match the reference implementations")
+
+if __name__ == "__main__":
+    main()
@@ -17,6 +17,12 @@ Inputs:
 Output:
   --out_xlsx     QA report workbook
 
+Options:
+  --jobs         worker processes for the row-wise checks (0 = all cores; default 1 = in-process);
+                 only pays off on large inputs: the pool's start-up and the pickled row
+                 results cost more than they save on the bundled Rosaceae data
+  --xlsx_engine  openpyxl (default) | calamine (faster; needs python-calamine, decodes _x000D_ escapes)
+
 Implements (minimal sufficient quantification):
   (1) Coverage
   (2) Terminology adherence (term recall) against morphology term KB
@@ -29,16 +35,39 @@ Notes:
 - NUM uses multiset comparison to tolerate re-ordering of phrases.
 """
 
-import argparse, re
+import argparse, os, re, sys
 import pandas as pd
 import numpy as np
-from collections import defaultdict, Counter
-
+import xlsxwriter
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass
+from functools import lru_cache
+
+# engine: "calamine" (pip install python-calamine) is several times faster but
+# decodes OOXML escapes such as _x000D_, which openpyxl keeps verbatim (and whose
+# digits then count for NUM), so it is opt-in via --xlsx_engine
+def read_xlsx(path, engine="openpyxl", **kw):
+    return pd.read_excel(path, engine=engine, **kw)
+
+# text helpers: coerce to str outside, cache on the str inside (bounded)
 def norm_ws(s):
-    return re.sub(r'\s+', ' ', str(s or '')).strip()
+    return _norm_ws(str(s or ''))
+
+@lru_cache(maxsize=65536)
+def _norm_ws(s):
+    # str.split() splits on exactly the characters \s matches
+    return ' '.join(s.split())
+
+html_re = re.compile(r'<[^>]+>')
 
 def strip_html(s):
-    return re.sub(r'<[^>]+>', '', str(s or ''))
+    return _strip_html(str(s or ''))
+
+@lru_cache(maxsize=65536)
+def _strip_html(s):
+    return html_re.sub('', s)
 
 # --- month normalization (to tolerate May–Jun -> 5–6月 conversions) ---
 month_map = {
@@ -65,13 +94,26 @@ def normalize_months(text):
 
 
 # regex
-num_re = re.compile(r'(?<![A-Za-z])(\d+(?:\.\d+)?)')
-range_re = re.compile(r'(\d+(?:\.\d+)?)\s*[–\-~－]\s*(\d+(?:\.\d+)?)')
-unit_en_re = re.compile(r'\b(mm|cm|dm|m|km|µm|um)\b', re.IGNORECASE)
 abbr_candidate_re = re.compile(r'\b(?:[A-Z]\.){1,4}(?:\s?[A-Za-z]{2,}\.)?\b')
 surname_period_re = re.compile(r'\b[A-Z][A-Za-z\-]{2,}\.\b')
-word_re = re.compile(r"[A-Za-z]+(?:-[A-Za-z]+)*")
-tag_re = re.compile(r'<\s*/?\s*([A-Za-z0-9]+)[^>]*>')
+term_word_re = re.compile(rb"[a-z]+(?:-[a-z]+)*")  # hyphenated words, on lowercased ASCII bytes
+
+# fused single-pass scanners
+# - facts (on HTML-stripped text): numbers, ranges, units.
+#   A range exists iff some digit is followed by <sep><digit>; that digit either
+#   ends a number match (lookahead group) or directly follows a letter (lrange).
+fact_re = re.compile(
+    r'(?P<num>(?<![A-Za-z])\d+(?:\.\d+)?)(?P<range>(?=\s*[–\-~－]\s*\d))?'
+    r'|(?P<lrange>\d(?=\s*[–\-~－]\s*\d))'
+    r'|\b(?P<unit>(?i:mm|cm|dm|m|km|µm|um))\b'
+)
+# - markup (on raw text): <i>…</i> spans (each also counts as two "i" tags) and other tags
+markup_re = re.compile(
+    r'(?P<ital>(?i:<i>)\s*(?P<itext>[^<]+?)\s*(?i:</i>))'
+    r'|(?P<tag><\s*/?\s*(?P<tname>[A-Za-z0-9]+)[^>]*>)'
+)
+italic_re = re.compile(r'<i>\s*([^<]+?)\s*</i>', re.I)
+binomial_re = re.compile(r'\b([A-Z][a-z-]+)\s+([a-z-]{2,})\b')
 
 unit_map = {
     "mm": ["mm","毫米"],
@@ -84,69 +126,113 @@ unit_map = {
 }
 neg_triggers = ["not","without","rarely","usually","often","sometimes","absent","lacking","except"]
 zh_cues = ["不","无","未","非","缺","没有","罕","稀","很少","常","通常","一般","除外","而非","而不是"]
-
-def extract_numbers(s): 
-    return num_re.findall(s or "")
-
-def has_range(s):
-    return bool(range_re.search(s or ""))
-
-def extract_units_en(s):
-    return [u.lower() for u in unit_en_re.findall(s or "")]
-
-def units_pass(en, zh):
-    en_units = extract_units_en(en)
+# "any of these substrings?" as one search each
+neg_trigger_re = re.compile("|".join(map(re.escape, neg_triggers)))
+zh_cue_re = re.compile("|".join(map(re.escape, zh_cues)))
+unit_cand_re = {u: re.compile("|".join(map(re.escape, cands))) for u,cands in unit_map.items()}
+
+# nums/tags are sorted tuples: multiset equality is plain tuple equality
+@dataclass(frozen=True)
+class EnScan:
+    nums: tuple
+    has_range: bool
+    units: tuple
+    tags: tuple
+    binomials: tuple
+    neg: bool  # any negation/hedge trigger
+
+@dataclass(frozen=True)
+class ZhScan:
+    clean: str  # HTML-stripped text
+    nums: tuple
+    has_range: bool
+    tags: tuple
+
+def scan_facts(clean):
+    nums=[]
+    units=[]
+    rng=False
+    for m in fact_re.finditer(clean):
+        kind = m.lastgroup
+        if kind == "unit":
+            units.append(m.group("unit").lower())
+        elif kind == "lrange":
+            rng = True
+        else:
+            nums.append(m.group("num"))
+            if m.group("range") is not None:
+                rng = True
+    return tuple(sorted(nums)), rng, tuple(units)
+
+def scan_markup(raw):
+    tags=[]
+    itexts=[]
+    unclosed=False
+    for m in markup_re.finditer(raw):
+        if m.lastgroup == "tag":
+            tags.append(m.group("tname").lower())
+            # a tag running over another "<" may hide an <i>…</i> span
+            unclosed = unclosed or "<" in m.group("tag")[1:]
+        else:
+            tags += ["i", "i"]
+            itexts.append(m.group("itext"))
+    if unclosed:
+        itexts = italic_re.findall(raw)
+    bins=[]
+    for it in itexts:
+        bins += binomial_re.findall(it)
+    return tuple(sorted(tags)), tuple(bins)
+
+@lru_cache(maxsize=65536)
+def scan_en(en):
+    raw = str(en or "")
+    clean = strip_html(raw)
+    nums, rng, units = scan_facts(clean)
+    tags, bins = scan_markup(raw)
+    neg = bool(neg_trigger_re.search(clean.lower()))
+    return EnScan(nums, rng, units, tags, bins, neg)
+
+@lru_cache(maxsize=65536)
+def scan_zh(zh):
+    raw = str(zh or "")
+    clean = strip_html(raw)
+    nums, rng, _ = scan_facts(clean)
+    tags, _ = scan_markup(raw)
+    return ZhScan(clean, nums, rng, tags)
+
+def units_pass(en_units, zh):
     if not en_units:
         return True
     z = str(zh or "")
     for u in en_units:
-        candidates = unit_map.get(u, [u])
-        if not any(c in z for c in candidates):
+        pat = unit_cand_re.get(u)
+        if not (pat.search(z) if pat else u in z):
             return False
     return True
 
-def negation_pass(en, zh):
-    en_l = (en or "").lower()
-    triggers = [t for t in neg_triggers if t in en_l]
-    if not triggers:
-        return True
-    z = str(zh or "")
-    return any(c in z for c in zh_cues)
-
-def italic_binomials(text):
-    s = str(text or "")
-    ital = re.findall(r'<i>\s*([^<]+?)\s*</i>', s, flags=re.I)
-    bins=[]
-    for it in ital:
-        it = strip_html(it)
-        bins += re.findall(r'\b([A-Z][a-z-]+)\s+([a-z-]{2,})\b', it)
-    return bins
+def negation_pass(e, z):
+    return not e.neg or bool(zh_cue_re.search(z.clean))
 
 def binomial_pass(en, zh):
     # enforce only when source explicitly marks taxa with <i> tags
-    bins = italic_binomials(en)
+    bins = scan_en(en).binomials
     if not bins:
         return True
-    z = strip_html(zh).lower()
+    z = scan_zh(zh).clean.lower()
     for g,s in bins:
         if f"{g} {s}".lower() not in z:
             return False
     return True
 
-def symbols_pass(en, zh):
-    for sym in ["±","×"]:
-        if sym in (en or "") and sym not in (zh or ""):
-            return False
-    return True
-
-def tag_mismatch(en, zh):
-    return bool(tag_re.findall(en or "")) and (Counter([t.lower() for t in tag_re.findall(en or "")]) != Counter([t.lower() for t in tag_re.findall(zh or "")]))
-
 # --- term KB ---
 def normalize_en_term(en):
-    en = norm_ws(en).lower()
+    return _normalize_en_term(norm_ws(en))
+
+@lru_cache(maxsize=65536)
+def _normalize_en_term(en):
+    en = en.lower()
     en = re.sub(r'\s*\(.*?\)\s*', ' ', en)
-    en = re.sub(r'\s+',' ', en).strip()
+    en = ' '.join(en.split())
     return en
 
 def singularize_token(tok):
@@ -182,22 +268,73 @@ def build_term_kb(term_tsv):
             continue
         for v in make_en_variants(en):
             en2zh[v].add(zh)
+    # freeze: interned keys, candidates as sorted tuples (so hits come out pre-sorted)
+    en2zh = {sys.intern(k): tuple(sorted(sys.intern(z) for z in zs)) for k,zs in en2zh.items()}
     max_words = min(max((len(k.split()) for k in en2zh.keys()), default=4), 6)
     return en2zh, max_words
 
-def match_terms(en2zh, max_words, en_text):
-    tokens = [t.lower() for t in word_re.findall(strip_html(en_text or ""))]
-    hits=set()
+def build_term_trie(en2zh, max_words):
+    # token trie over KB keys (None marks a complete term); one walk per start
+    # token finds every hit, including nested/overlapping ones
+    trie={}
+    for k in en2zh:
+        toks = k.split(" ")
+        if len(toks) > max_words:
+            continue
+        node=trie
+        for t in toks:
+            node = node.setdefault(t, {})
+        node[None] = k
+    return trie
+
+def term_text(col):
+    # whole column -> "tok tok tok" (HTML stripped, [A-Za-z] words, lowercased)
+    return col.astype(str).map(_term_text)
+
+@lru_cache(maxsize=65536)
+def _term_text(s):
+    # single scan over an ASCII byte buffer: non-ASCII chars become '?', which
+    # (like any non-letter) splits tokens, and bytes.lower() touches ASCII only
+    buf = strip_html(s).encode("ascii", "replace").lower()
+    return b" ".join(term_word_re.findall(buf)).decode("ascii")
+
+# --- loaded KBs (module-level so the cached checks below key on text only) ---
+en2zh = {}
+term_trie = {}
+abbr_map = {}
+fullname_map = {}
+verifiable_cn = {}
+
+def load_kbs(term_tsv, names_xlsx, engine="openpyxl"):
+    en2zh, max_words = build_term_kb(term_tsv)
+    abbr_map, fullname_map, verifiable_cn = build_name_kb(names_xlsx, engine)
+    return en2zh, build_term_trie(en2zh, max_words), abbr_map, fullname_map, verifiable_cn
+
+def set_kbs(kbs):
+    # also the ProcessPoolExecutor initializer: KBs are shipped once per worker
+    global en2zh, term_trie, abbr_map, fullname_map, verifiable_cn
+    en2zh, term_trie, abbr_map, fullname_map, verifiable_cn = kbs
+    match_terms.cache_clear()
+
+@lru_cache(maxsize=65536)
+def match_terms(text):
+    tokens = text.split()
     L=len(tokens)
-    for n in range(1, max_words+1):
-        for i in range(0, L-n+1):
-            ng=" ".join(tokens[i:i+n])
-            if ng in en2zh:
-                hits.add(ng)
-    return sorted(hits)
-
-def term_metrics(en2zh, max_words, en_text, zh_text):
-    hits = match_terms(en2zh, max_words, en_text)
+    trie=term_trie
+    hits=set()
+    for i, tok in enumerate(tokens):
+        # most tokens start no term: one root probe, no inner loop
+        node=trie.get(tok)
+        j=i
+        while node is not None:
+            if None in node:
+                hits.add(node[None])
+            j += 1
+            node = node.get(tokens[j]) if j < L else None
+    return tuple(sorted(hits))
+
+def term_metrics(text, zh_text):
+    hits = match_terms(text)
     if not hits:
         return 0, 0, None, [], {}
     zh = str(zh_text or "")
@@ -206,44 +343,46 @@ def term_metrics(en2zh, max_words, en_text, zh_text):
     found_map={}
     for en_term in hits:
         cands = en2zh[en_term]
-        found=[z for z in cands if z and z in zh]
+        found=[z for z in cands if z in zh]
         if found:
             ok += 1
-            found_map[en_term]=sorted(found)
+            found_map[en_term]=found
         else:
             missing.append(en_term)
     recall = ok/len(hits) if hits else None
     return len(hits), ok, recall, missing[:20], found_map
 
 # --- name KB (verifiable subset) ---
-def build_name_kb(names_xlsx):
-    df = pd.read_excel(names_xlsx, sheet_name="Sheet1").fillna("")
+def build_name_kb(names_xlsx, engine="openpyxl"):
+    df = read_xlsx(names_xlsx, engine, sheet_name="Sheet1").fillna("")
     abbr_map={}
     fullname_map={}
     cn_map={}
     for i,r in df.iterrows():
         cn_map[i]=norm_ws(r.get("中文名",""))
         for k in ["去掉空格的缩写","标准缩写"]:
-            ab = re.sub(r'\s+','', str(r.get(k,""))).strip()
+            ab = ''.join(str(r.get(k,"")).split())
             if ab:
                 abbr_map[ab]=i
         for k in ["全名，把逗号换成了空格","全名"]:
             fn = norm_ws(r.get(k,""))
             if fn:
                 fn_norm = re.sub(r'[^a-z ]','', fn.lower())
-                fn_norm = re.sub(r'\s+',' ', fn_norm).strip()
+                fn_norm = ' '.join(fn_norm.split())
                 if fn_norm:
                     fullname_map[fn_norm]=i
-    return abbr_map, fullname_map, cn_map
+    # only ids with a usable Chinese name can be verified; placeholders drop out here
+    verifiable_cn = {i: cn for i,cn in cn_map.items() if cn and cn not in {"【空】","?","？"}}
+    return abbr_map, fullname_map, verifiable_cn
 
 def extract_person_abbr(en_text):
     en = en_text or ""
     cands=set()
     for m in abbr_candidate_re.findall(en):
-        cands.add(re.sub(r'\s+','', m))
+        cands.add(''.join(m.split()))
     for m in surname_period_re.findall(en):
-        cands.add(re.sub(r'\s+','', m))
-    return cands
+        cands.add(''.join(m.split()))
+    return frozenset(cands)
 
 def extract_fullname(en_text):
     en = en_text or ""
@@ -255,16 +394,19 @@ def extract_fullname(en_text):
         if not p:
             continue
         p2 = re.sub(r'[^A-Za-z.\- ]+', ' ', p)
-        p2 = re.sub(r'\s+',' ', p2).strip()
+        p2 = ' '.join(p2.split())
         words=[w for w in p2.split() if re.search(r'[A-Za-z]', w)]
         if len(words) >= 2:
             cand_norm = re.sub(r'[^a-z ]','', " ".join(words).lower())
-            cand_norm = re.sub(r'\s+',' ', cand_norm).strip()
+            cand_norm = ' '.join(cand_norm.split())
             if cand_norm:
                 cands.add(cand_norm)
-    return cands
+    return frozenset(cands)
 
-def person_eval(abbr_map, fullname_map, cn_map, en_text, zh_text):
+# (status, verifiable_n, expected_cn, reason, matched_ids)
+PERSON_NA = ("NA", 0, "", "", "")
+
+def person_eval(en_text, zh_text):
     en = en_text or ""
     zh = str(zh_text or "")
     matched=set()
@@ -276,8 +418,8 @@ def person_eval(abbr_map, fullname_map, cn_map, en_text, zh_text):
         if ab in abbr_map:
             idx=abbr_map[ab]
             matched.add(idx)
-            cn=cn_map.get(idx,"")
-            if cn and cn not in ["【空】","?","？"]:
+            cn=verifiable_cn.get(idx)
+            if cn:
                 verifiable += 1
                 if cn not in zh:
                     ok=False
@@ -287,51 +429,77 @@ def person_eval(abbr_map, fullname_map, cn_map, en_text, zh_text):
         if fn in fullname_map:
             idx=fullname_map[fn]
             matched.add(idx)
-            cn=cn_map.get(idx,"")
-            if cn and cn not in ["【空】","?","？"]:
+            cn=verifiable_cn.get(idx)
+            if cn:
                 verifiable += 1
                 if cn not in zh:
                     ok=False
                     expected.add(cn)
                     reasons.add("CN_MISSING")
     if not matched:
-        return {"status":"NA","verifiable_n":0,"expected_cn":"","reason":"","matched_ids":""}
-    return {
-        "status":"OK" if ok else "FAIL",
-        "verifiable_n":verifiable,
-        "expected_cn":";".join(sorted(expected)),
-        "reason":",".join(sorted(reasons)),
-        "matched_ids":";".join(str(i) for i in sorted(matched))
-    }
+        return PERSON_NA
+    return (
+        "OK" if ok else "FAIL",
+        verifiable,
+        ";".join(sorted(expected)),
+        ",".join(sorted(reasons)),
+        ";".join(str(i) for i in sorted(matched)),
+    )
 
 # --- core flags ---
-def critical_flags(en, zh):
+def critical_flags(en, zh, sym_ok):
+    # sym_ok: the row's symbols_mask value (the ±/× rule is only implemented there)
     flags=[]
-    en_clean = strip_html(en or "")
-    zh_clean = strip_html(zh or "")
-    en_nums = extract_numbers(en_clean)
-    zh_nums = extract_numbers(zh_clean)
-    if en_nums and Counter(en_nums) != Counter(zh_nums):
+    e = scan_en(en)
+    # early exit: without numbers, units, negation triggers or markup in the
+    # source (ranges imply numbers, binomials imply <i> tags) only SYMBOL can fire
+    if not (e.nums or e.units or e.neg or e.tags):
+        return () if sym_ok else ("SYMBOL",)
+    z = scan_zh(zh)
+    if e.nums and e.nums != z.nums:
         flags.append("NUM")
-    if has_range(en_clean) and not has_range(zh_clean):
+    if e.has_range and not z.has_range:
         flags.append("RANGE")
-    if not units_pass(en_clean, zh_clean):
+    if not units_pass(e.units, z.clean):
         flags.append("UNIT")
-    if not negation_pass(en_clean, zh_clean):
+    if not negation_pass(e, z):
         flags.append("NEGATION_CUE")
     if not binomial_pass(en, zh):
         flags.append("BINOMIAL")
-    if not symbols_pass(en, zh):
+    if not sym_ok:
         flags.append("SYMBOL")
     # soft indicator only
-    if tag_mismatch(en or "", zh or ""):
+    if e.tags and e.tags != z.tags:
         flags.append("TAG")
-    return flags
+    return tuple(flags)
 
 def short(s, n=260):
     s = norm_ws(s)
     return s if len(s)<=n else s[:n]+"…"
 
+def column(df, name, default=""):
+    # object array of one column (stands in for r.get(name, default) per row)
+    if name in df.columns:
+        return df[name].to_numpy()
+    return np.full(len(df), default, dtype=object)
+
+def translated_mask(col):
+    # norm_ws keeps str(s or '') semantics: falsy cells (0, False) are untranslated
+    return col.map(norm_ws).ne("")
+
+def scope_mask(col):
+    return col.astype(str).str.strip().str.lower().ne("synonym")
+
+def symbols_mask(en_col, zh_col):
+    # SYMBOL rule, feeding both critical_flags and EntityPass: no ± / × present
+    # in EN but missing in ZH (cells compared as str, so numeric cells just pass)
+    en = en_col.astype(str)
+    zh = zh_col.astype(str)
+    ok = pd.Series(True, index=en.index)
+    for sym in ["±","×"]:
+        ok &= ~en.str.contains(sym, regex=False) | zh.str.contains(sym, regex=False)
+    return ok
+
 def summarize_block(df):
     out = {}
     out["N_rows"] = len(df)
@@ -346,42 +514,22 @@ def summarize_block(df):
     out["Name_accuracy_on_verifiable_rows"] = (ver["PersonStatus"]=="OK").mean() if len(ver) else np.nan
     return out
 
-def main():
-    ap = argparse.ArgumentParser()
-    ap.add_argument("--key_xlsx", required=True)
-    ap.add_argument("--desc_xlsx", required=True)
-    ap.add_argument("--term_tsv", required=True)
-    ap.add_argument("--names_xlsx", required=True)
-    ap.add_argument("--out_xlsx", required=True)
-    args = ap.parse_args()
-
-    en2zh, max_words = build_term_kb(args.term_tsv)
-    abbr_map, fullname_map, cn_map = build_name_kb(args.names_xlsx)
-
-    df_key = pd.read_excel(args.key_xlsx).fillna("")
-    df_desc = pd.read_excel(args.desc_xlsx).fillna("")
-
-    term_variant_found = defaultdict(set)
-
-    # key
-    key_rows=[]
-    for _,r in df_key.iterrows():
-        en = r.get("Description","")
-        zh = r.get("Description_qw","")
-        translated = bool(norm_ws(zh))
-        th, tok, trec, tmiss, found_map = term_metrics(en2zh, max_words, en, zh) if translated else (0,0,None,[],{})
+def key_rows_chunk(cols):
+    rows=[]
+    variants=[]
+    for kid, key_no, item_no, branch, en, zh, text, translated, sym_ok in zip(*cols):
+        th, tok, trec, tmiss, found_map = term_metrics(text, zh) if translated else (0,0,None,[],{})
         for en_term, zhs in found_map.items():
-            for z in zhs:
-                term_variant_found[en_term].add(z)
-        flags = critical_flags(en, zh) if translated else ["UNTRANSLATED"]
+            variants += [(en_term, z) for z in zhs]
+        flags = critical_flags(en, zh, sym_ok) if translated else ("UNTRANSLATED",)
         core=[f for f in flags if f not in ["TAG"]]
         crit_pass = int(translated and len(core)==0)
-        entity_pass = int(translated and symbols_pass(en, zh))
-        key_rows.append({
-            "ID": r.get("ID",""),
-            "KeyNo": r.get("KeyNo",""),
-            "ItemNo": r.get("ItemNo",""),
-            "Branch": r.get("Branch",""),
+        entity_pass = int(translated and sym_ok)
+        rows.append({
+            "ID": kid,
+            "KeyNo": key_no,
+            "ItemNo": item_no,
+            "Branch": branch,
             "EN": en,
             "ZH_qw": zh,
             "Translated": int(translated),
@@ -393,28 +541,23 @@ def main():
             "CriticalPass": crit_pass,
             "EntityPass": entity_pass,
         })
-    df_key_q = pd.DataFrame(key_rows)
+    return rows, variants
 
-    # desc
-    desc_rows=[]
-    for _,r in df_desc.iterrows():
-        cat = r.get("CategoryValue","")
-        en = r.get("Content","")
-        zh = r.get("Content_qw","")
-        translated = bool(norm_ws(zh))
-        scope = 0 if str(cat).strip().lower()=="synonym" else 1
-        th, tok, trec, tmiss, found_map = term_metrics(en2zh, max_words, en, zh) if (translated and scope) else (0,0,None,[],{})
+def desc_rows_chunk(cols):
+    rows=[]
+    variants=[]
+    for did, taxon_id, cat, en, zh, text, translated, scope, sym_ok in zip(*cols):
+        th, tok, trec, tmiss, found_map = term_metrics(text, zh) if (translated and scope) else (0,0,None,[],{})
         for en_term, zhs in found_map.items():
-            for z in zhs:
-                term_variant_found[en_term].add(z)
-        flags = critical_flags(en, zh) if (translated and scope) else (["UNTRANSLATED"] if (scope and not translated) else ["OUT_OF_SCOPE"])
+            variants += [(en_term, z) for z in zhs]
+        flags = critical_flags(en, zh, sym_ok) if (translated and scope) else (("UNTRANSLATED",) if (scope and not translated) else ("OUT_OF_SCOPE",))
         core=[f for f in flags if f not in ["TAG"]]
         crit_pass = int(scope and translated and len(core)==0)
-        entity_pass = int(scope and translated and binomial_pass(en, zh) and symbols_pass(en, zh))
-        pe = person_eval(abbr_map, fullname_map, cn_map, en, zh) if (scope and translated) else {"status":"NA","verifiable_n":0,"expected_cn":"","reason":"","matched_ids":""}
-        desc_rows.append({
-            "id": r.get("id",""),
-            "TaxonId": r.get("TaxonId",""),
+        entity_pass = int(scope and translated and sym_ok and binomial_pass(en, zh))
+        p_status, p_ver_n, p_expected, p_reason, p_ids = person_eval(en, zh) if (scope and translated) else PERSON_NA
+        rows.append({
+            "id": did,
+            "TaxonId": taxon_id,
             "CategoryValue": cat,
             "EN": en,
             "ZH_qw": zh,
@@ -427,56 +570,187 @@ def main():
             "CriticalFlags": ",".join(flags),
             "CriticalPass": crit_pass,
             "EntityPass": entity_pass,
-            "PersonStatus": pe["status"],
-            "PersonVerifiableN": pe["verifiable_n"],
-            "PersonExpectedCN": pe["expected_cn"],
-            "PersonReason": pe["reason"],
-            "PersonMatchedIDs": pe["matched_ids"],
+            "PersonStatus": p_status,
+            "PersonVerifiableN": p_ver_n,
+            "PersonExpectedCN": p_expected,
+            "PersonReason": p_reason,
+            "PersonMatchedIDs": p_ids,
         })
-    df_desc_q = pd.DataFrame(desc_rows)
-    d_inscope = df_desc_q[df_desc_q["InScope"]==1]
-
-    # summary tables
-    df_kpi = pd.DataFrame([
-        {"Block":"Key (foc_key_qwkc)", **summarize_block(df_key_q)},
-        {"Block":"Description (in-scope)", **summarize_block(d_inscope)},
-    ])
-
-    cat_summ=[]
-    for cat, sub in d_inscope.groupby("CategoryValue"):
-        s = summarize_block(sub)
-        s["CategoryValue"]=cat
-        cat_summ.append(s)
-    df_cat_summary = pd.DataFrame(cat_summ).sort_values("N_rows", ascending=False)
-
-    term_drift=[]
-    for en_term, zhset in term_variant_found.items():
-        if len(zhset) >= 2:
-            term_drift.append({"en_term": en_term, "n_cn_variants": len(zhset), "cn_variants": " | ".join(sorted(zhset))})
-    df_term_drift = pd.DataFrame(term_drift).sort_values(["n_cn_variants","en_term"], ascending=[False, True])
-
-    top_key_issues = df_key_q[(df_key_q["Translated"]==1) & (df_key_q["CriticalPass"]==0)].copy()
-    top_key_issues["EN"]=top_key_issues["EN"].map(short)
-    top_key_issues["ZH_qw"]=top_key_issues["ZH_qw"].map(short)
-
-    top_desc_issues = d_inscope[(d_inscope["Translated"]==1) & (d_inscope["CriticalPass"]==0)].copy()
-    top_desc_issues["EN"]=top_desc_issues["EN"].map(short)
-    top_desc_issues["ZH_qw"]=top_desc_issues["ZH_qw"].map(short)
-
-    name_issues = d_inscope[(d_inscope["PersonVerifiableN"]>0) & (d_inscope["PersonStatus"]=="FAIL")].copy()
-    if len(name_issues):
-        name_issues["EN"]=name_issues["EN"].map(short)
-        name_issues["ZH_qw"]=name_issues["ZH_qw"].map(short)
-
-    with pd.ExcelWriter(args.out_xlsx, engine="xlsxwriter") as w:
-        df_kpi.to_excel(w, sheet_name="KPI_Summary", index=False)
-        df_cat_summary.to_excel(w, sheet_name="KPI_by_Category", index=False)
-        df_key_q.to_excel(w, sheet_name="Key_Rowwise", index=False)
-        df_desc_q.to_excel(w, sheet_name="Desc_Rowwise", index=False)
-        top_key_issues.to_excel(w, sheet_name="Top_Issues_Key", index=False)
-        top_desc_issues.to_excel(w, sheet_name="Top_Issues_Desc", index=False)
-        name_issues.to_excel(w, sheet_name="Name_Issues", index=False)
-        df_term_drift.to_excel(w, sheet_name="Term_Drift", index=False)
+    return rows, variants
+
+def map_chunks(ex, func, cols, n_chunks):
+    # split parallel columns into contiguous chunks; results come back in order
+    n = len(cols[0])
+    size = max(1, -(-n // n_chunks))
+    chunks = [[c[i:i+size] for c in cols] for i in range(0, n, size)]
+    return ex.map(func, chunks) if ex is not None else map(func, chunks)
+
+def xl_cell(v):
+    # constant_memory writes inline strings, which openpyxl reads back without
+    # unescaping (a literal "_x000D_" would come back as "_x005F_x000D_"); writing
+    # the CR it stands for reads back as "_x000D_" with openpyxl and "\r" with
+    # calamine, i.e. the same text either reader gets from the input workbooks
+    if isinstance(v, str):
+        return v.replace("_x000D_", "\r")
+    if isinstance(v, float) and v != v:
+        return None
+    return v
+
+def stream_rowwise(ws, header_fmt, results, keep, is_issue):
+    # write each row straight into its sheet as chunks arrive; only the columns
+    # the KPI tables need and the (few) issue rows are kept in memory
+    columns=None
+    kept=[]
+    issues=[]
+    variants=[]
+    i=0
+    for part_rows, part_variants in results:
+        for row in part_rows:
+            if columns is None:
+                columns = list(row)
+                ws.write_row(0, 0, columns, header_fmt)
+            i += 1
+            ws.write_row(i, 0, [xl_cell(v) for v in row.values()])
+            kept.append([row[c] for c in keep])
+            if is_issue(row):
+                issues.append(row)
+        variants += part_variants
+    return pd.DataFrame(kept, columns=keep), pd.DataFrame(issues, columns=columns), variants
+
+@contextmanager
+def atomic_output(path):
+    # yield a temp path next to `path`; it replaces `path` only if the block
+    # succeeds, so a failed run never leaves (or overwrites with) a partial report
+    d, base = os.path.split(os.path.abspath(path))
+    tmp = os.path.join(d, f".{base}.{os.getpid()}.tmp.xlsx")
+    try:
+        yield tmp
+        os.replace(tmp, path)
+    except BaseException:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+        raise
+
+def write_sheet(ws, df, header_fmt):
+    # row-major writer: xlsxwriter's constant_memory mode flushes each row as the
+    # next one starts, and DataFrame.to_excel writes column by column
+    ws.write_row(0, 0, [str(c) for c in df.columns], header_fmt)
+    for i, row in enumerate(df.itertuples(index=False, name=None), start=1):
+        ws.write_row(i, 0, [xl_cell(v) for v in row])
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--key_xlsx", required=True)
+    ap.add_argument("--desc_xlsx", required=True)
+    ap.add_argument("--term_tsv", required=True)
+    ap.add_argument("--names_xlsx", required=True)
+    ap.add_argument("--out_xlsx", required=True)
+    ap.add_argument("--jobs", type=int, default=1, help="worker processes for the row-wise checks (0 = all cores; default 1). "
+                    "Only pays off on large inputs on multi-core machines; on the bundled Rosaceae data it is no faster than 1")
+    ap.add_argument("--xlsx_engine", choices=["openpyxl","calamine"], default="openpyxl", help="pandas engine for reading the input workbooks")
+    args = ap.parse_args()
+    if args.jobs < 0:
+        ap.error("--jobs must be >= 0")
+
+    kbs = load_kbs(args.term_tsv, args.names_xlsx, args.xlsx_engine)
+    set_kbs(kbs)
+
+    df_key = read_xlsx(args.key_xlsx, args.xlsx_engine).fillna("")
+    df_desc = read_xlsx(args.desc_xlsx, args.xlsx_engine).fillna("")
+
+    # key (masks are built from the same column() arrays, so a missing column
+    # reads as "" everywhere, like the old r.get(name, "") default)
+    key_cols = [column(df_key, c) for c in ["ID","KeyNo","ItemNo","Branch","Description","Description_qw"]]
+    key_en, key_zh = pd.Series(key_cols[4]), pd.Series(key_cols[5])
+    key_cols += [
+        term_text(key_en).tolist(),
+        translated_mask(key_zh).tolist(),
+        symbols_mask(key_en, key_zh).tolist(),
+    ]
+
+    # desc
+    desc_cols = [column(df_desc, c) for c in ["id","TaxonId","CategoryValue","Content","Content_qw"]]
+    desc_cat, desc_en, desc_zh = pd.Series(desc_cols[2]), pd.Series(desc_cols[3]), pd.Series(desc_cols[4])
+    desc_cols += [
+        term_text(desc_en).tolist(),
+        translated_mask(desc_zh).tolist(),
+        scope_mask(desc_cat).astype(int).tolist(),
+        symbols_mask(desc_en, desc_zh).tolist(),
+    ]
+
+    sheet_names = ["KPI_Summary","KPI_by_Category","Key_Rowwise","Desc_Rowwise",
+                   "Top_Issues_Key","Top_Issues_Desc","Name_Issues","Term_Drift"]
+    kpi_cols = ["Translated","TermHits","TermRecall","CriticalPass","EntityPass"]
+    desc_kpi_cols = kpi_cols + ["InScope","CategoryValue","PersonVerifiableN","PersonStatus"]
+
+    def is_key_issue(r):
+        return r["Translated"]==1 and r["CriticalPass"]==0
+
+    def is_desc_issue(r):
+        # Top_Issues_Desc or Name_Issues candidate
+        return r["InScope"]==1 and ((r["Translated"]==1 and r["CriticalPass"]==0) or
+                                    (r["PersonVerifiableN"]>0 and r["PersonStatus"]=="FAIL"))
+
+    jobs = args.jobs or os.cpu_count() or 1
+    with atomic_output(args.out_xlsx) as tmp_xlsx, xlsxwriter.Workbook(tmp_xlsx, {"constant_memory": True}) as wb:
+        # same header look as DataFrame.to_excel
+        header_fmt = wb.add_format({"bold": True, "border": 1, "align": "center", "valign": "top"})
+        ws = {name: wb.add_worksheet(name) for name in sheet_names}
+
+        ex = ProcessPoolExecutor(jobs, initializer=set_kbs, initargs=(kbs,)) if jobs > 1 else None
+        try:
+            df_key_q, key_issues, key_variants = stream_rowwise(
+                ws["Key_Rowwise"], header_fmt, map_chunks(ex, key_rows_chunk, key_cols, jobs), kpi_cols, is_key_issue)
+            df_desc_q, desc_issues, desc_variants = stream_rowwise(
+                ws["Desc_Rowwise"], header_fmt, map_chunks(ex, desc_rows_chunk, desc_cols, jobs), desc_kpi_cols, is_desc_issue)
+        finally:
+            if ex is not None:
+                ex.shutdown()
+
+        # (en_term, zh) pairs from all rows -> CN variants seen per term
+        term_variant_found = defaultdict(set)
+        for en_term, z in key_variants + desc_variants:
+            term_variant_found[en_term].add(z)
+        d_inscope = df_desc_q[df_desc_q["InScope"]==1]
+
+        # summary tables
+        df_kpi = pd.DataFrame([
+            {"Block":"Key (foc_key_qwkc)", **summarize_block(df_key_q)},
+            {"Block":"Description (in-scope)", **summarize_block(d_inscope)},
+        ])
+
+        cat_summ=[]
+        for cat, sub in d_inscope.groupby("CategoryValue"):
+            s = summarize_block(sub)
+            s["CategoryValue"]=cat
+            cat_summ.append(s)
+        df_cat_summary = pd.DataFrame(cat_summ).sort_values("N_rows", ascending=False)
+
+        term_drift=[]
+        for en_term, zhset in term_variant_found.items():
+            if len(zhset) >= 2:
+                term_drift.append({"en_term": en_term, "n_cn_variants": len(zhset), "cn_variants": " | ".join(sorted(zhset))})
+        df_term_drift = pd.DataFrame(term_drift).sort_values(["n_cn_variants","en_term"], ascending=[False, True])
+
+        top_key_issues = key_issues.copy()
+        top_key_issues["EN"]=top_key_issues["EN"].map(short)
+        top_key_issues["ZH_qw"]=top_key_issues["ZH_qw"].map(short)
+
+        top_desc_issues = desc_issues[(desc_issues["Translated"]==1) & (desc_issues["CriticalPass"]==0)].copy()
+        top_desc_issues["EN"]=top_desc_issues["EN"].map(short)
+        top_desc_issues["ZH_qw"]=top_desc_issues["ZH_qw"].map(short)
+
+        name_issues = desc_issues[(desc_issues["PersonVerifiableN"]>0) & (desc_issues["PersonStatus"]=="FAIL")].copy()
+        if len(name_issues):
+            name_issues["EN"]=name_issues["EN"].map(short)
+            name_issues["ZH_qw"]=name_issues["ZH_qw"].map(short)
+
+        write_sheet(ws["KPI_Summary"], df_kpi, header_fmt)
+        write_sheet(ws["KPI_by_Category"], df_cat_summary, header_fmt)
+        write_sheet(ws["Top_Issues_Key"], top_key_issues, header_fmt)
+        write_sheet(ws["Top_Issues_Desc"], top_desc_issues, header_fmt)
+        write_sheet(ws["Name_Issues"], name_issues, header_fmt)
+        write_sheet(ws["Term_Drift"], df_term_drift, header_fmt)
 
 if __name__ == "__main__":
     main()